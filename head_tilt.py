@@ -1,13 +1,13 @@
 import cv2
 import mediapipe as mp
 import pygame
-import sys
+from render_backends import create_backend
 
 # ========== INIT ==========
 pygame.init()
 WIDTH, HEIGHT = 640, 480
-win = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("🙂 Easy Head Tilt Maze")
+display = create_backend("🙂 Easy Head Tilt Maze", default="pygame")
+win = display.canvas((WIDTH, HEIGHT))
 
 WHITE, BLUE, RED, GREEN, BLACK = (255, 255, 255), (100, 100, 255), (255, 50, 50), (50, 200, 100), (0, 0, 0)
 clock = pygame.time.Clock()
@@ -45,83 +45,86 @@ font = pygame.font.SysFont("arial", 20)
 win_message = ""
 
 # ========== MAIN GAME LOOP ==========
-while True:
-    ret, frame = cap.read()
-    if not ret:
-        break
-
-    frame = cv2.flip(frame, 1)
-    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    results = face_mesh.process(frame_rgb)
-
-    # Events
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            cap.release()
-            pygame.quit()
-            sys.exit()
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_r:
-                calibrated = False
-                win_message = ""
+try:
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+
+        frame = cv2.flip(frame, 1)
+        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        results = face_mesh.process(frame_rgb)
+
+        # Get nose tip
+        if results.multi_face_landmarks:
+            nose = results.multi_face_landmarks[0].landmark[1]
+            nose_x = int(nose.x * WIDTH)
+            nose_y = int(nose.y * HEIGHT)
+
+            # Calibrate head center
+            if not calibrated:
+                calib_x, calib_y = nose_x, nose_y
+                calibrated = True
+            else:
+                dx = nose_x - calib_x
+                dy = nose_y - calib_y
+
+                if dx > tilt_sensitivity:
+                    dot_x += dot_speed
+                elif dx < -tilt_sensitivity:
+                    dot_x -= dot_speed
+                if dy > tilt_sensitivity:
+                    dot_y += dot_speed
+                elif dy < -tilt_sensitivity:
+                    dot_y -= dot_speed
+
+        # Stay in bounds
+        dot_x = max(dot_radius, min(WIDTH - dot_radius, dot_x))
+        dot_y = max(dot_radius, min(HEIGHT - dot_radius, dot_y))
+
+        # Collision detection
+        dot_rect = pygame.Rect(dot_x - dot_radius, dot_y - dot_radius, dot_radius * 2, dot_radius * 2)
+        for wall in walls:
+            if dot_rect.colliderect(wall):
                 dot_x, dot_y = start_pos
+                win_message = ""
 
-    # Get nose tip
-    if results.multi_face_landmarks:
-        nose = results.multi_face_landmarks[0].landmark[1]
-        nose_x = int(nose.x * WIDTH)
-        nose_y = int(nose.y * HEIGHT)
+        # Check finish
+        if dot_rect.colliderect(finish_zone):
+            win_message = "🎉 You made it!"
+            dot_x, dot_y = start_pos
+            calibrated = False
+
+        # ========== DRAW ==========
+        win.fill(WHITE)
+        for wall in walls:
+            pygame.draw.rect(win, BLUE, wall)
+        pygame.draw.circle(win, RED, (dot_x, dot_y), dot_radius)
+        pygame.draw.rect(win, GREEN, finish_zone)
 
-        # Calibrate head center
         if not calibrated:
-            calib_x, calib_y = nose_x, nose_y
-            calibrated = True
+            text = font.render("Look straight to calibrate...", True, BLACK)
         else:
-            dx = nose_x - calib_x
-            dy = nose_y - calib_y
-
-            if dx > tilt_sensitivity:
-                dot_x += dot_speed
-            elif dx < -tilt_sensitivity:
-                dot_x -= dot_speed
-            if dy > tilt_sensitivity:
-                dot_y += dot_speed
-            elif dy < -tilt_sensitivity:
-                dot_y -= dot_speed
-
-    # Stay in bounds
-    dot_x = max(dot_radius, min(WIDTH - dot_radius, dot_x))
-    dot_y = max(dot_radius, min(HEIGHT - dot_radius, dot_y))
-
-    # Collision detection
-    dot_rect = pygame.Rect(dot_x - dot_radius, dot_y - dot_radius, dot_radius * 2, dot_radius * 2)
-    for wall in walls:
-        if dot_rect.colliderect(wall):
-            dot_x, dot_y = start_pos
-            win_message = ""
-
-    # Check finish
-    if dot_rect.colliderect(finish_zone):
-        win_message = "🎉 You made it!"
-        dot_x, dot_y = start_pos
-        calibrated = False
+            text = font.render("Tilt your head to move. Press R to reset.", True, BLACK)
 
-    # ========== DRAW ==========
-    win.fill(WHITE)
-    for wall in walls:
-        pygame.draw.rect(win, BLUE, wall)
-    pygame.draw.circle(win, RED, (dot_x, dot_y), dot_radius)
-    pygame.draw.rect(win, GREEN, finish_zone)
+        win.blit(text, (WIDTH // 2 - text.get_width() // 2, 10))
 
-    if not calibrated:
-        text = font.render("Look straight to calibrate...", True, BLACK)
-    else:
-        text = font.render("Tilt your head to move. Press R to reset.", True, BLACK)
+        if win_message:
+            win.blit(font.render(win_message, True, (0, 150, 0)), (WIDTH // 2 - 80, HEIGHT - 40))
 
-    win.blit(text, (WIDTH // 2 - text.get_width() // 2, 10))
+        # Present the frame and handle events
+        key = display.show_surface(win)
+        if key == ord('q'):
+            break
+        elif key == ord('r'):
+            calibrated = False
+            win_message = ""
+            dot_x, dot_y = start_pos
 
-    if win_message:
-        win.blit(font.render(win_message, True, (0, 150, 0)), (WIDTH // 2 - 80, HEIGHT - 40))
+        if display.paced:
+            clock.tick(FPS)
 
-    pygame.display.update()
-    clock.tick(FPS)
+finally:
+    cap.release()
+    display.close()
+    pygame.quit()
@@ -4,6 +4,7 @@ import numpy as np
 import random
 import time
 import screeninfo
+from render_backends import create_backend
 
 # Initialize MediaPipe Hands
 mp_hands = mp.solutions.hands
@@ -84,8 +85,7 @@ if not cap.isOpened():
     exit()
 
 # Set up full-screen window
-cv2.namedWindow("Mosquito Catcher Game", cv2.WND_PROP_FULLSCREEN)
-cv2.setWindowProperty("Mosquito Catcher Game", cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN)
+display = create_backend("Mosquito Catcher Game", fullscreen=True)
 
 reset_game()  # Start the game
 
@@ -215,10 +215,8 @@ try:
                          int(GAME_HEIGHT // 2 + 70 * game_over_font_scale)), 
                         cv2.FONT_HERSHEY_SIMPLEX, game_over_font_scale * 0.5, (255, 255, 255), game_over_thickness)
         
-        cv2.imshow("Mosquito Catcher Game", display_img)
-        
-        # Handle key events
-        key = cv2.waitKey(10) & 0xFF
+        # Present the frame and handle key events
+        key = display.show(display_img, 10)
         if key == ord('q'):
             break
         elif key == ord('r'):
@@ -227,4 +225,4 @@ try:
 
 finally:
     cap.release()
-    cv2.destroyAllWindows()
+    display.close()
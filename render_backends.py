@@ -0,0 +1,266 @@
+import os
+import queue
+import threading
+
+import cv2
+import numpy as np
+
+# Key code returned when the window is closed or a frame budget runs out,
+# so every game can keep treating it like a 'q' press
+QUIT_KEY = ord('q')
+NO_KEY = -1
+
+
+class RenderBackend:
+    """Shows BGR NumPy frames and reports key presses like cv2.waitKey."""
+
+    # Interactive backends pace the game through their key waits,
+    # headless ones run as fast as the game loop allows
+    paced = True
+
+    def __init__(self, title, fullscreen=False):
+        self.title = title
+        self.fullscreen = fullscreen
+
+    def show(self, frame, wait_ms=1):
+        raise NotImplementedError
+
+    def wait_key(self, wait_ms=1):
+        raise NotImplementedError
+
+    def canvas(self, size):
+        # Surface a pygame game draws into before calling show_surface()
+        import pygame
+        return pygame.Surface(size)
+
+    def show_surface(self, surface, wait_ms=1):
+        return self.show(surface_to_frame(surface), wait_ms)
+
+    def close(self):
+        pass
+
+
+class OpenCVBackend(RenderBackend):
+    """Presents frames in a HighGUI window."""
+
+    def __init__(self, title, fullscreen=False):
+        super().__init__(title, fullscreen)
+        self.shown = False
+        if fullscreen:
+            cv2.namedWindow(title, cv2.WND_PROP_FULLSCREEN)
+            cv2.setWindowProperty(title, cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_FULLSCREEN)
+
+    def show(self, frame, wait_ms=1):
+        cv2.imshow(self.title, frame)
+        self.shown = True
+        return self.wait_key(wait_ms)
+
+    def wait_key(self, wait_ms=1):
+        key = cv2.waitKey(wait_ms)
+        # The window only exists after the first imshow. HighGUI builds
+        # without this property report -1, so only 0 means closed
+        if self.shown and cv2.getWindowProperty(self.title, cv2.WND_PROP_VISIBLE) == 0:
+            return QUIT_KEY
+        return key & 0xFF if key != NO_KEY else NO_KEY
+
+    def close(self):
+        cv2.destroyAllWindows()
+
+
+class PygameBackend(RenderBackend):
+    """Presents frames in a pygame window.
+
+    Frames are wrapped with pygame.image.frombuffer, which shares the
+    NumPy buffer instead of converting it, so the only copy per frame is
+    the blit into the display surface.
+    """
+
+    def __init__(self, title, fullscreen=False):
+        super().__init__(title, fullscreen)
+        import pygame
+        self.pygame = pygame
+        pygame.display.init()
+        pygame.display.set_caption(title)
+        self.window = None
+
+    def _window(self, size):
+        if self.window is None or self.window.get_size() != size:
+            flags = self.pygame.FULLSCREEN if self.fullscreen else 0
+            self.window = self.pygame.display.set_mode(size, flags)
+        return self.window
+
+    def canvas(self, size):
+        # pygame games draw straight into the display surface
+        return self._window(size)
+
+    def show(self, frame, wait_ms=1):
+        frame = to_color(frame)
+        h, w = frame.shape[:2]
+        if not frame.flags["C_CONTIGUOUS"]:
+            frame = np.ascontiguousarray(frame)
+        fmt = "BGRA" if frame.shape[2] == 4 else "BGR"
+        # The surface borrows the array memory, so frame must outlive the blit
+        surface = self.pygame.image.frombuffer(frame, (w, h), fmt)
+        self._window((w, h)).blit(surface, (0, 0))
+        self.pygame.display.flip()
+        return self.wait_key(wait_ms)
+
+    def show_surface(self, surface, wait_ms=1):
+        window = self._window(surface.get_size())
+        if surface is not window:
+            window.blit(surface, (0, 0))
+        self.pygame.display.flip()
+        return self.wait_key(wait_ms)
+
+    def wait_key(self, wait_ms=1):
+        if wait_ms >= 1:
+            self.pygame.time.wait(wait_ms)
+        key = NO_KEY
+        for event in self.pygame.event.get():
+            if event.type == self.pygame.QUIT:
+                return QUIT_KEY
+            # Key constants for letters are their lowercase ASCII codes, so
+            # Shift and Caps Lock don't change them; keys outside the 8-bit
+            # range (F-keys, arrows) are ignored
+            if event.type == self.pygame.KEYDOWN and key == NO_KEY and event.key <= 0xFF:
+                key = event.key
+        return key
+
+    def close(self):
+        self.pygame.display.quit()
+
+
+class HeadlessBackend(RenderBackend):
+    """Renders without a display.
+
+    Frames are discarded, or encoded to a video file on a background thread
+    when output is given. Key waits never sleep. Once max_frames frames have
+    been shown every wait reports QUIT_KEY, and so does any wait without a
+    new frame, since no key can ever arrive to end it.
+    """
+
+    paced = False
+
+    def __init__(self, title, fullscreen=False, output=None, fps=30, max_frames=None, queue_size=64):
+        super().__init__(title, fullscreen)
+        self.max_frames = max_frames
+        self.frames = 0
+        self.dropped = 0
+        self.output = output
+        self.fps = fps
+        self.queue = None
+        self.worker = None
+        self.error = None
+        if output:
+            self.queue = queue.Queue(maxsize=queue_size)
+            self.worker = threading.Thread(target=self._encode, daemon=True)
+            self.worker.start()
+
+    def _encode(self):
+        writer = None
+        try:
+            while True:
+                frame = self.queue.get()
+                if frame is None:
+                    break
+                frame = to_color(frame)
+                if frame.shape[2] == 4:
+                    frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+                if writer is None:
+                    h, w = frame.shape[:2]
+                    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+                    writer = cv2.VideoWriter(self.output, fourcc, self.fps, (w, h))
+                    if not writer.isOpened():
+                        raise RuntimeError(f"Could not open video writer for {self.output}")
+                writer.write(frame)
+        except Exception as e:
+            # Handed back to the game thread by _check_encoder()
+            self.error = e
+        finally:
+            if writer is not None:
+                writer.release()
+
+    def _check_encoder(self):
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def show(self, frame, wait_ms=1):
+        # Games reuse and draw over their buffers, so hand the encoder
+        # its own copy
+        return self._submit(frame.copy() if self.queue is not None else None)
+
+    def show_surface(self, surface, wait_ms=1):
+        # Skip the conversion when discarding; when recording, the
+        # converted array is already a fresh copy
+        return self._submit(surface_to_frame(surface) if self.queue is not None else None)
+
+    def _submit(self, frame):
+        self._check_encoder()
+        self.frames += 1
+        if frame is not None:
+            try:
+                self.queue.put_nowait(frame)
+            except queue.Full:
+                self.dropped += 1
+        if self.max_frames is not None and self.frames >= self.max_frames:
+            return QUIT_KEY
+        return NO_KEY
+
+    def wait_key(self, wait_ms=1):
+        # Games only wait without presenting when they block on input
+        # (e.g. a game-over screen), which would otherwise spin forever
+        return QUIT_KEY
+
+    def close(self):
+        if self.worker is not None:
+            # A dead worker no longer drains the queue, so don't block on it
+            while self.worker.is_alive():
+                try:
+                    self.queue.put(None, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+            self.worker.join()
+            self.worker = None
+        if self.dropped:
+            print(f"Headless encoder dropped {self.dropped} of {self.frames} frames")
+        self._check_encoder()
+
+
+def to_color(frame):
+    # Grayscale frames are fine for cv2.imshow, so accept them everywhere
+    if frame.ndim == 2:
+        return cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+    return frame
+
+
+def surface_to_frame(surface):
+    import pygame
+    # pixels3d is a (w, h, RGB) view of the surface; swap axes and
+    # channels to get the (h, w, BGR) layout the backends expect
+    view = pygame.surfarray.pixels3d(surface)
+    frame = np.ascontiguousarray(view.swapaxes(0, 1)[..., ::-1])
+    del view  # release the surface lock
+    return frame
+
+
+BACKENDS = {
+    "opencv": OpenCVBackend,
+    "pygame": PygameBackend,
+    "headless": HeadlessBackend,
+}
+
+
+def create_backend(title, default="opencv", fullscreen=False):
+    # CVGAMES_BACKEND picks the backend; CVGAMES_RECORD and
+    # CVGAMES_MAX_FRAMES configure the headless one
+    name = os.environ.get("CVGAMES_BACKEND", default).lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown render backend: {name} (choose from {', '.join(BACKENDS)})")
+    if name == "headless":
+        max_frames = os.environ.get("CVGAMES_MAX_FRAMES")
+        return HeadlessBackend(title, fullscreen,
+                               output=os.environ.get("CVGAMES_RECORD"),
+                               max_frames=int(max_frames) if max_frames else None)
+    return BACKENDS[name](title, fullscreen)
@@ -6,6 +6,7 @@ import time
 import pygame
 from cvzone.HandTrackingModule import HandDetector
 import cvzone
+from render_backends import create_backend
 
 # Init pygame for sound
 pygame.init()
@@ -87,6 +88,7 @@ class SnakeGameClass:
 cap = cv2.VideoCapture(0)
 cap.set(3, 1280)
 cap.set(4, 720)
+display = create_backend("Snake Game")
 game = SnakeGameClass("images/Donut.png")
 start_game = False
 game_duration = 40
@@ -105,8 +107,7 @@ def run_countdown():
         img = cv2.flip(frame, 1)
         show_intro_screen(img)
         cv2.putText(img, f"{i}", (620, 500), cv2.FONT_HERSHEY_DUPLEX, 4, (0, 255, 0), 5)
-        cv2.imshow("Snake Game", img)
-        cv2.waitKey(1000)
+        display.show(img, 1000)
 
 def show_game_over(img, score):
     cv2.putText(img, "GAME OVER", (420, 300), cv2.FONT_HERSHEY_SIMPLEX, 2.2, (0, 0, 255), 6)
@@ -122,38 +123,38 @@ def reset_and_start_game():
     start_game = True
 
 # Main Game Loop
-while True:
-    success, img = cap.read()
-    if not success:
-        break
-    img = cv2.flip(img, 1)
+try:
+    while True:
+        success, img = cap.read()
+        if not success:
+            break
+        img = cv2.flip(img, 1)
+
+        if not start_game:
+            show_intro_screen(img)
+            display.show(img, 1)
+            reset_and_start_game()
+            continue
+
+        current_time = time.time()
+        if current_time < end_time:
+            hands, img = detector.findHands(img, flipType=False)
+            if hands:
+                pointIndex = hands[0]['lmList'][8][0:2]
+                img = game.update(img, pointIndex)
+
+            # Show time remaining
+            cv2.putText(img, f"Time Left: {int(end_time - current_time)}s", (950, 60), cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 255, 255), 3)
+        else:
+            game.gameOver = True
+            show_game_over(img, game.score)
+
+        key = display.show(img, 1)
+        if key == ord('q'):
+            break
+        if key == ord('r') and game.gameOver:
+            start_game = False  # Triggers countdown again
 
-    if not start_game:
-        show_intro_screen(img)
-        cv2.imshow("Snake Game", img)
-        cv2.waitKey(1)
-        reset_and_start_game()
-        continue
-
-    current_time = time.time()
-    if current_time < end_time:
-        hands, img = detector.findHands(img, flipType=False)
-        if hands:
-            pointIndex = hands[0]['lmList'][8][0:2]
-            img = game.update(img, pointIndex)
-
-        # Show time remaining
-        cv2.putText(img, f"Time Left: {int(end_time - current_time)}s", (950, 60), cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 255, 255), 3)
-    else:
-        game.gameOver = True
-        show_game_over(img, game.score)
-
-    cv2.imshow("Snake Game", img)
-    key = cv2.waitKey(1)
-    if key == ord('q'):
-        break
-    if key == ord('r') and game.gameOver:
-        start_game = False  # Triggers countdown again
-
-cap.release()
-cv2.destroyAllWindows()
+finally:
+    cap.release()
+    display.close()